@@ -38,15 +38,19 @@ Optional args (when __main__ executed):
   --triangles=400         Override triangle threshold
   --token=Building        Override building path token
   --limit=100            Only show first N matches in table
+  --jobs=4                Accepted for compatibility; ignored (UE API calls are game-thread-only)
 
 Note: This script MODIFIES assets by setting LOD0 reduction to 100%.
 """
 
 from __future__ import annotations
 import unreal
+import _mesh_scan
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Iterable, Optional
+from typing import List, Optional
 import os
+import re
 
 # ---------------- Configuration ---------------- #
 
@@ -54,9 +58,12 @@ REDUCTION_THRESHOLD_UI = 9.0         # UI percent below which mesh is considered
 TRIANGLE_THRESHOLD = 500             # LOD0 triangle count below which mesh is considered too sparse
 BUILDING_TOKEN = "Building"          # substring required in package path
 SEARCH_PATHS = ["/Game"]             # Content root paths to search
-CLASS_NAMES = ["StaticMesh"]
-RECURSIVE_PATHS = True
-RECURSIVE_CLASSES = True
+# Opt-in: narrow the registry query to folders whose path contains the
+# token. Only safe when every candidate lives under such a folder — a mesh
+# whose token appears only in the package file name (e.g.
+# /Game/Props/SM_BuildingDoor) is excluded by the narrowed query and the
+# later Python-side filter cannot bring it back.
+NARROW_TO_TOKEN_FOLDERS = False
 CSV_DEFAULT_RELATIVE = os.path.join("Saved", "OverReducedReport.csv")
 TARGET_PERCENT_RAW = 1.0             # restore to 100% (raw 1.0)
 TARGET_PERCENT_UI = 100.0            # restore to 100% (UI display)
@@ -80,7 +87,7 @@ def _log(msg: str):
     unreal.log(f"[OverReducedFinder] {msg}")
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshInfo:
     name: str
     package_path: str
@@ -111,87 +118,79 @@ class MeshInfo:
 
 # --------------- Core Unreal Helpers --------------- #
 
-def _get_asset_registry():
-    return unreal.AssetRegistryHelpers.get_asset_registry()
-
-
-def iter_static_meshes() -> Iterable[unreal.StaticMesh]:
+# The registry/subsystem caches, tag parsing and property accessors are
+# shared with TrianglesListMaker via _mesh_scan; keep local aliases for the
+# pieces the fix phase uses directly.
+_get_asset_registry = _mesh_scan.get_asset_registry
+_smes = _mesh_scan.get_smes
+get_triangle_count_from_tag = _mesh_scan.get_triangle_count_from_tag
+get_percent_triangles_lod0 = _mesh_scan.get_percent_triangles_lod0
+get_lod0_triangle_count = _mesh_scan.get_lod0_triangle_count
+
+
+def resolve_building_search_paths(building_token: str) -> List[str]:
+    """Resolve SEARCH_PATHS down to the sub-paths containing the building token.
+
+    Enumerating sub-paths is a single cheap registry call; passing only the
+    matching folders as package_paths means the registry never returns
+    non-building AssetData in the first place. This matches the token against
+    FOLDER paths only, so it misses meshes whose token appears just in the
+    package file name — hence it only runs when NARROW_TO_TOKEN_FOLDERS is
+    opted in for projects whose buildings all live in token-named folders.
+    Falls back to SEARCH_PATHS if narrowing is off, enumeration fails or
+    nothing matches.
+    """
+    if not NARROW_TO_TOKEN_FOLDERS:
+        return list(SEARCH_PATHS)
     registry = _get_asset_registry()
-    ar_filter = unreal.ARFilter(
-        class_names=CLASS_NAMES,
-        recursive_paths=RECURSIVE_PATHS,
-        recursive_classes=RECURSIVE_CLASSES,
-        package_paths=SEARCH_PATHS,
-        include_only_on_disk_assets=False,
-    )
-    assets = registry.get_assets(ar_filter)
-    for a in assets:
+    token_lc = building_token.lower()
+    narrowed: List[str] = []
+    for root in SEARCH_PATHS:
+        # Positional call: the binding names this parameter in_recurse, so a
+        # recurse= keyword raises TypeError. Only the registry call itself
+        # sits in the try so a signature bug cannot hide behind the
+        # fallback.
         try:
-            sm = a.get_asset()
-            if isinstance(sm, unreal.StaticMesh):
-                yield sm
+            sub_paths = registry.get_sub_paths(root, True)
         except Exception:
-            continue
-
-
-def get_percent_triangles_lod0(static_mesh: unreal.StaticMesh) -> Optional[float]:
-    # Same fallback strategy as other scripts
-    try:
-        lods = static_mesh.get_editor_property("lods")
-        if lods:
-            red = lods[0].get_editor_property("reduction_settings")
-            return float(red.percent_triangles)
-    except Exception:
-        pass
-    try:
-        source_models = static_mesh.get_editor_property("source_models")
-        if source_models:
-            red = source_models[0].get_editor_property("reduction_settings")
-            return float(red.percent_triangles)
-    except Exception:
-        pass
-    try:
-        smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
-        settings = smes.get_lod_reduction_settings(static_mesh, 0)
-        if settings:
-            return float(settings.percent_triangles)
-    except Exception:
-        pass
-    return None
-
-
-def get_lod0_triangle_count(static_mesh: unreal.StaticMesh) -> int:
-    try:
-        if hasattr(static_mesh, 'get_num_triangles'):
-            return int(static_mesh.get_num_triangles(0))
-    except Exception:
-        pass
-    # Fallback attempt via editor data (less reliable)
-    try:
-        render_data = static_mesh.get_editor_property('render_data') if hasattr(static_mesh, 'get_editor_property') else None
-        if render_data and hasattr(render_data, 'lods'):
-            lods = getattr(render_data, 'lods', [])
-            if lods:
-                lod0 = lods[0]
-                if hasattr(lod0, 'get_num_triangles'):
-                    return int(lod0.get_num_triangles())
-    except Exception:
-        pass
-    return -1  # unknown
+            return list(SEARCH_PATHS)
+        for sub in sub_paths:
+            sub_str = str(sub)
+            if token_lc in sub_str.lower():
+                narrowed.append(sub_str)
+    return narrowed if narrowed else list(SEARCH_PATHS)
 
 
 def set_percent_triangles_lod0(static_mesh: unreal.StaticMesh, value_raw: float) -> bool:
-    """Set LOD0 reduction percent triangles. Returns True if successful."""
-    # Same fallback strategy as percenttriangles.py
+    """Set LOD0 reduction percent triangles. Returns True if successful.
+
+    The LOD/source-model paths write the inner reduction struct in place and
+    only round-trip the outer array through set_editor_property when the
+    in-place write did not stick; re-assigning the whole array marshals every
+    LOD's source model across the Python boundary per call.
+    """
     # 1) Direct LOD path
     try:
         lods = static_mesh.get_editor_property("lods")
         if lods:
             lod0 = lods[0]
             red = lod0.get_editor_property("reduction_settings")
+            # modify() snapshots the CURRENT state into the open transaction,
+            # so it must run before the first mutating write — after it, the
+            # snapshot would hold the new value and undo would restore
+            # nothing.
+            static_mesh.modify()
             red.set_editor_property("percent_triangles", value_raw)
             lod0.set_editor_property("reduction_settings", red)
-            static_mesh.set_editor_property("lods", lods)
+            # Verify against a FRESH read from the mesh: when the array was
+            # marshalled as a detached copy, re-reading the local `lods`
+            # object would just see our own mutation and "pass" while the
+            # mesh stayed unchanged.
+            check = static_mesh.get_editor_property("lods")[0].get_editor_property("reduction_settings")
+            if abs(float(check.percent_triangles) - value_raw) > EPS_RAW:
+                # In-place write was on a copy; fall back to the full array
+                # round-trip.
+                static_mesh.set_editor_property("lods", lods)
             return True
     except Exception:
         pass
@@ -200,15 +199,20 @@ def set_percent_triangles_lod0(static_mesh: unreal.StaticMesh, value_raw: float)
         source_models = static_mesh.get_editor_property("source_models")
         if source_models:
             red = source_models[0].get_editor_property("reduction_settings")
+            # Pre-change snapshot, as in the LOD path.
+            static_mesh.modify()
             red.set_editor_property("percent_triangles", value_raw)
             source_models[0].set_editor_property("reduction_settings", red)
-            static_mesh.set_editor_property("source_models", source_models)
+            # Fresh read from the mesh for the same reason as the LOD path.
+            check = static_mesh.get_editor_property("source_models")[0].get_editor_property("reduction_settings")
+            if abs(float(check.percent_triangles) - value_raw) > EPS_RAW:
+                static_mesh.set_editor_property("source_models", source_models)
             return True
     except Exception:
         pass
     # 3) StaticMeshEditorSubsystem API
     try:
-        smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+        smes = _smes()
         settings = smes.get_lod_reduction_settings(static_mesh, 0)
         if settings:
             settings.set_editor_property("percent_triangles", value_raw)
@@ -219,49 +223,57 @@ def set_percent_triangles_lod0(static_mesh: unreal.StaticMesh, value_raw: float)
     return False
 
 
-def build_and_save(static_mesh: unreal.StaticMesh) -> bool:
-    """Rebuild LODs and save asset. Returns True if successful."""
-    smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
-    build_ok = False
-    # Try different build APIs
-    try:
+# Resolved once: hasattr on UE-wrapped objects walks the reflected property
+# table, so probing the available build APIs per mesh adds up over a batch.
+_build_fn = None
+
+
+def _resolve_build_fn():
+    global _build_fn
+    if _build_fn is None:
+        smes = _smes()
         if hasattr(smes, 'rebuild_lods'):
-            smes.rebuild_lods(static_mesh)
-            build_ok = True
+            _build_fn = smes.rebuild_lods
+        elif hasattr(smes, 'build_static_mesh'):
+            _build_fn = smes.build_static_mesh
+        else:
+            _build_fn = lambda sm: sm.build()
+    return _build_fn
+
+
+def build_lods(static_mesh: unreal.StaticMesh) -> bool:
+    """Rebuild LODs only (no save). Returns True if successful."""
+    try:
+        _resolve_build_fn()(static_mesh)
+        return True
     except Exception:
-        pass
-    if not build_ok:
-        try:
-            if hasattr(smes, 'build_static_mesh'):
-                smes.build_static_mesh(static_mesh)
-                build_ok = True
-        except Exception:
-            pass
-    if not build_ok:
-        try:
-            if hasattr(static_mesh, 'build'):
-                static_mesh.build()
-                build_ok = True
-        except Exception:
-            pass
-    
-    # Save asset
-    save_ok = False
+        return False
+
+
+def save_modified(meshes: List[MeshInfo]) -> bool:
+    """Save all fixed meshes with a single batched save_packages call.
+
+    Per-mesh saves flush each package to disk synchronously; batching the
+    dirty packages into one call pays that cost once for the whole run.
+    """
+    fixed = [m for m in meshes if m.action == "FIXED"]
+    if not fixed:
+        return True
     try:
-        unreal.EditorAssetLibrary.save_loaded_asset(static_mesh)
-        save_ok = True
+        packages = [m.asset.get_outermost() for m in fixed]
+        unreal.EditorLoadingAndSavingUtils.save_packages(packages, only_dirty=True)
+        return True
     except Exception:
         pass
-    if not save_ok:
+    # Fallback: per-asset save (slow path, only when the bulk API is missing)
+    save_ok = True
+    for m in fixed:
         try:
-            package = static_mesh.get_outer()
-            if hasattr(unreal, 'EditorLoadingAndSavingUtils'):
-                unreal.EditorLoadingAndSavingUtils.save_packages([package], only_dirty=True)
-                save_ok = True
+            unreal.EditorAssetLibrary.save_loaded_asset(m.asset)
         except Exception:
-            pass
-    
-    return build_ok and save_ok
+            m.action = "SAVE-FAIL"
+            save_ok = False
+    return save_ok
 
 
 def is_over_reduced(percent_raw: Optional[float], reduction_threshold_raw: float) -> bool:
@@ -270,49 +282,76 @@ def is_over_reduced(percent_raw: Optional[float], reduction_threshold_raw: float
     return percent_raw < reduction_threshold_raw
 
 
+def compile_token_pattern(token):
+    """Case-insensitive matcher for one or more tokens, compiled once per scan.
+
+    Matching with a compiled pattern runs in C and avoids allocating a
+    lowercased copy of every package path in the hot loop. Multiple tokens
+    (a list/tuple) compile into one alternation, so the per-path cost stays
+    a single scan no matter how many tokens are configured.
+    """
+    tokens = [token] if isinstance(token, str) else list(token)
+    return re.compile("|".join(re.escape(t) for t in tokens), re.IGNORECASE)
+
+
 def has_building_token(package_path: str, token: str) -> bool:
-    return token.lower() in package_path.lower()
+    return compile_token_pattern(token).search(package_path) is not None
+
+
+def _match_token_indices(package_names: List[str], token: str) -> List[int]:
+    """Return indices of package names containing the token.
+
+    One comprehension over the compiled pattern: the regex scan holds the
+    GIL, so fanning chunks across worker threads buys no parallelism and
+    only adds pool/chunking overhead. (File IO, by contrast, does release
+    the GIL — which is why the CSV write runs on a worker.)
+    """
+    search = compile_token_pattern(token).search
+    return [i for i, p in enumerate(package_names) if search(p)]
 
 
 def collect_candidates(reduction_threshold_raw: float, tri_threshold: int, building_token: str) -> List[MeshInfo]:
     results: List[MeshInfo] = []
-    for sm in iter_static_meshes():
-        name = sm.get_name()
-        package_path = sm.get_path_name()
-        
-        # Filter by building token first (quick check)
-        if not has_building_token(package_path, building_token):
-            continue
-            
-        tri_count = get_lod0_triangle_count(sm)
-        pct_raw = get_percent_triangles_lod0(sm)
-        
+    search_paths = resolve_building_search_paths(building_token)
+
+    def bulk_filter(package_names: List[str]) -> List[int]:
+        return _match_token_indices(package_names, building_token)
+
+    def keep(ad, tag_tris) -> bool:
+        # Meshes at/above the triangle threshold can never qualify; reject
+        # them from the tag hint without paying for a package load.
+        return tag_tris < tri_threshold
+
+    for rec in _mesh_scan.scan_meshes(search_paths, predicate=keep, bulk_path_filter=bulk_filter):
         # Skip if tri count unknown
-        if tri_count < 0:
+        if rec.triangle_count < 0:
             continue
-            
+
         # Check all conditions: over-reduced AND low triangle count
-        if (is_over_reduced(pct_raw, reduction_threshold_raw) and 
-            tri_count < tri_threshold):
+        if (is_over_reduced(rec.percent_raw, reduction_threshold_raw) and
+            rec.triangle_count < tri_threshold):
             results.append(MeshInfo(
-                name=name,
-                package_path=package_path,
-                triangle_count=tri_count,
-                percent_raw_before=pct_raw if pct_raw is not None else 0.0,
-                asset=sm,
+                name=rec.name,
+                package_path=rec.package_path,
+                triangle_count=rec.triangle_count,
+                percent_raw_before=rec.percent_raw if rec.percent_raw is not None else 0.0,
+                asset=rec.asset,
             ))
     return results
 
 
 def format_table(rows: List[List[str]]) -> str:
-    # dynamic width: use configured width but allow bigger if content longer
-    col_widths = []
-    for idx, (header, default_w) in enumerate(COLS):
-        max_content = max([len(r[idx]) for r in rows] + [len(header)]) if rows else len(header)
-        col_widths.append(max(default_w, max_content))
-    header_line = ' '.join(h.ljust(col_widths[i]) for i, (h, _) in enumerate(COLS))
-    sep_line = ' '.join('-' * col_widths[i] for i in range(len(COLS)))
-    body_lines = [' '.join(r[i].ljust(col_widths[i]) for i in range(len(COLS))) for r in rows]
+    # One pass over all cells to find widths (configured width is the floor),
+    # instead of a max() comprehension per column.
+    widths = [len(h) for h, _ in COLS]
+    for r in rows:
+        for i, cell in enumerate(r):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    widths = [max(w, default_w) for w, (_, default_w) in zip(widths, COLS)]
+    header_line = ' '.join(h.ljust(widths[i]) for i, (h, _) in enumerate(COLS))
+    sep_line = ' '.join('-' * w for w in widths)
+    body_lines = [' '.join(cell.ljust(widths[i]) for i, cell in enumerate(r)) for r in rows]
     return '\n'.join([header_line, sep_line] + body_lines)
 
 
@@ -334,20 +373,25 @@ def write_csv(meshes: List[MeshInfo], csv_path: str):
 
 
 def process_mesh(mesh_info: MeshInfo, dry_run: bool = True) -> bool:
-    """Process a single mesh. Returns True if successful."""
+    """Apply the reduction fix to a single mesh (set + rebuild, no save).
+
+    Saving is deferred to save_modified() so the whole batch flushes to disk
+    in one save_packages call.
+    """
     if dry_run:
         mesh_info.action = "DRY-RUN"
         mesh_info.percent_raw_after = TARGET_PERCENT_RAW
         return True
-    
+
     # Actually apply the fix
-    if set_percent_triangles_lod0(mesh_info.asset, TARGET_PERCENT_RAW):
-        if build_and_save(mesh_info.asset):
+    set_ok = set_percent_triangles_lod0(mesh_info.asset, TARGET_PERCENT_RAW)
+    if set_ok:
+        if build_lods(mesh_info.asset):
             mesh_info.action = "FIXED"
             mesh_info.percent_raw_after = TARGET_PERCENT_RAW
             return True
         else:
-            mesh_info.action = "SAVE-FAIL"
+            mesh_info.action = "BUILD-FAIL"
             return False
     else:
         mesh_info.action = "SET-FAIL"
@@ -359,7 +403,8 @@ def run(reduction_threshold_ui: float = REDUCTION_THRESHOLD_UI,
         building_token: str = BUILDING_TOKEN,
         csv: Optional[str] = None, 
         limit: Optional[int] = None, 
-        dry_run: bool = False):
+        dry_run: bool = False,
+        jobs: int = 1):
     
     reduction_threshold_raw = reduction_threshold_ui / 100.0
     mode = "DRY-RUN" if dry_run else "APPLYING FIXES"
@@ -375,36 +420,61 @@ def run(reduction_threshold_ui: float = REDUCTION_THRESHOLD_UI,
         _log("No over-reduced meshes found!")
         return meshes
     
-    # Process each mesh
+    # Process each mesh inside one transaction so undo/notify overhead is
+    # paid once for the batch, then flush all dirty packages in one save.
     fixed = 0
     failed = 0
-    for mesh in meshes:
-        if process_mesh(mesh, dry_run):
-            fixed += 1
-        else:
-            failed += 1
-    
+    if dry_run:
+        for mesh in meshes:
+            if process_mesh(mesh, dry_run):
+                fixed += 1
+            else:
+                failed += 1
+    else:
+        # jobs is accepted for compatibility but never parallelizes: the UE
+        # Python API is game-thread-only, so subsystem build calls from
+        # worker threads would trip the engine's thread checks.
+        if jobs > 1:
+            _log(f"--jobs={jobs} ignored: UE API calls must stay on the game thread; processing sequentially")
+        with unreal.ScopedEditorTransaction("OverReducedFix"):
+            for mesh in meshes:
+                if process_mesh(mesh, dry_run):
+                    fixed += 1
+                else:
+                    failed += 1
+        if not save_modified(meshes):
+            _log("Warning: one or more packages failed to save (see SAVE-FAIL rows)")
+
+    # Kick the CSV write off on a worker thread so it overlaps with table
+    # formatting/logging on the main thread (both are pure Python).
+    csv_future = None
+    csv_path = None
+    if csv:
+        csv_path = os.path.abspath(csv)
+        csv_pool = ThreadPoolExecutor(max_workers=1)
+        csv_future = csv_pool.submit(write_csv, meshes, csv_path)
+        csv_pool.shutdown(wait=False)
+
     display = meshes if limit is None else meshes[:limit]
     rows = [m.to_row() for m in display]
     table = format_table(rows)
     for line in table.splitlines():
         unreal.log(line)
-    
+
     if limit is not None and len(meshes) > limit:
         _log(f"(Showing first {limit} of {len(meshes)}; use --limit=<n> to change or omit to show all)")
-    
+
     _log(f"Results: {fixed} successful, {failed} failed")
     if dry_run:
         _log("DRY RUN - no changes applied. Use dry_run=False or --apply to actually fix meshes.")
-    
-    if csv:
-        csv_path = os.path.abspath(csv)
+
+    if csv_future is not None:
         try:
-            write_csv(meshes, csv_path)
+            csv_future.result()
             _log(f"CSV written: {csv_path}")
         except Exception as e:
             _log(f"Failed to write CSV '{csv_path}': {e}")
-    
+
     _log("Done.")
     return meshes
 
@@ -418,6 +488,7 @@ def _parse_args(argv):
     parser.add_argument('--csv', nargs='?', const=CSV_DEFAULT_RELATIVE, default=None, help='Write CSV (optional path)')
     parser.add_argument('--limit', type=int, default=None, help='Limit number of displayed rows')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without applying')
+    parser.add_argument('--jobs', type=int, default=1, help='Accepted for compatibility; ignored (UE API is game-thread-only)')
     parser.add_argument('--apply', action='store_true', default=True, help='Actually apply the fixes (default)')
     return parser.parse_args(argv)
 
@@ -431,4 +502,5 @@ if __name__ == "__main__":
         building_token=args.token,
         csv=args.csv, 
         limit=args.limit, 
-        dry_run=dry_run)
\ No newline at end of file
+        dry_run=dry_run,
+        jobs=args.jobs)
\ No newline at end of file
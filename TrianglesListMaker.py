@@ -35,8 +35,10 @@ Note: This script does not modify assets.
 
 from __future__ import annotations
 import unreal
+import _mesh_scan
 from dataclasses import dataclass
-from typing import List, Iterable, Optional
+from operator import attrgetter
+from typing import Callable, List, Optional
 import os
 
 # ---------------- Configuration ---------------- #
@@ -44,9 +46,6 @@ import os
 TRIANGLE_THRESHOLD = 50000          # LOD0 triangle count required to report
 UNREDUCED_MIN_RAW = 0.99             # raw percent_triangles >= this value considered unreduced (UI ~99%)
 SEARCH_PATHS = ["/Game"]              # Content root paths to search
-CLASS_NAMES = ["StaticMesh"]
-RECURSIVE_PATHS = True
-RECURSIVE_CLASSES = True
 CSV_DEFAULT_RELATIVE = os.path.join("Saved", "TrianglesReport.csv")  # relative to project root if used
 OPEN_TOP_DEFAULT = 50  # default number of top meshes to auto-open for editing (set None or 0 to disable)
 
@@ -67,7 +66,7 @@ def _log(msg: str):
 	unreal.log(f"[TrianglesListMaker] {msg}")
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshInfo:
 	name: str
 	package_path: str
@@ -93,75 +92,14 @@ class MeshInfo:
 
 # --------------- Core Unreal Helpers --------------- #
 
-def _get_asset_registry():
-	return unreal.AssetRegistryHelpers.get_asset_registry()
-
-
-def iter_static_meshes() -> Iterable[unreal.StaticMesh]:
-	registry = _get_asset_registry()
-	ar_filter = unreal.ARFilter(
-		class_names=CLASS_NAMES,
-		recursive_paths=RECURSIVE_PATHS,
-		recursive_classes=RECURSIVE_CLASSES,
-		package_paths=SEARCH_PATHS,
-		include_only_on_disk_assets=False,
-	)
-	assets = registry.get_assets(ar_filter)
-	for a in assets:
-		try:
-			sm = a.get_asset()
-			if isinstance(sm, unreal.StaticMesh):
-				yield sm
-		except Exception:
-			continue
-
-
-def get_percent_triangles_lod0(static_mesh: unreal.StaticMesh) -> Optional[float]:
-	# Similar heuristics as percenttriangles.py
-	try:
-		lods = static_mesh.get_editor_property("lods")
-		if lods:
-			red = lods[0].get_editor_property("reduction_settings")
-			return float(red.percent_triangles)
-	except Exception:
-		pass
-	try:
-		source_models = static_mesh.get_editor_property("source_models")
-		if source_models:
-			red = source_models[0].get_editor_property("reduction_settings")
-			return float(red.percent_triangles)
-	except Exception:
-		pass
-	try:
-		smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
-		settings = smes.get_lod_reduction_settings(static_mesh, 0)
-		if settings:
-			return float(settings.percent_triangles)
-	except Exception:
-		pass
-	return None
-
-
-def get_lod0_triangle_count(static_mesh: unreal.StaticMesh) -> int:
-	try:
-		if hasattr(static_mesh, 'get_num_triangles'):
-			return int(static_mesh.get_num_triangles(0))
-	except Exception:
-		pass
-	# Fallback attempt via editor data (less reliable)
-	try:
-		# access render data? Might not exist in all contexts.
-		render_data = static_mesh.get_editor_property('render_data') if hasattr(static_mesh, 'get_editor_property') else None
-		if render_data and hasattr(render_data, 'lods'):
-			lods = getattr(render_data, 'lods', [])
-			if lods:
-				# attempt to call get_num_triangles() if provided
-				lod0 = lods[0]
-				if hasattr(lod0, 'get_num_triangles'):
-					return int(lod0.get_num_triangles())
-	except Exception:
-		pass
-	return -1  # unknown
+# The registry/subsystem caches, tag parsing and property accessors are
+# shared with OverReducedFinder via _mesh_scan; keep local aliases so the
+# public helper names of this module stay importable.
+_get_asset_registry = _mesh_scan.get_asset_registry
+_smes = _mesh_scan.get_smes
+get_triangle_count_from_tag = _mesh_scan.get_triangle_count_from_tag
+get_percent_triangles_lod0 = _mesh_scan.get_percent_triangles_lod0
+get_lod0_triangle_count = _mesh_scan.get_lod0_triangle_count
 
 
 def is_unreduced(percent_raw: Optional[float], min_raw: float) -> bool:
@@ -170,65 +108,76 @@ def is_unreduced(percent_raw: Optional[float], min_raw: float) -> bool:
 	return percent_raw + EPS_RAW >= min_raw
 
 
-def collect_candidates(tri_threshold: int, unreduced_min_raw: float) -> List[MeshInfo]:
+def collect_candidates(tri_threshold: int, unreduced_min_raw: float, on_candidate: Optional[Callable[[MeshInfo], None]] = None) -> List[MeshInfo]:
 	results: List[MeshInfo] = []
-	for sm in iter_static_meshes():
-		name = sm.get_name()
-		tri_count = get_lod0_triangle_count(sm)
-		pct_raw = get_percent_triangles_lod0(sm)
-		try:
-			nanite_state = bool(sm.is_nanite_enabled())
-		except Exception:
-			# fallback older property path
-			nanite_state = False
-			try:
-				nanite_settings = sm.get_editor_property('nanite_settings')
-				if nanite_settings:
-					nanite_state = bool(getattr(nanite_settings, 'enabled', False))
-			except Exception:
-				pass
+
+	def keep(ad, tag_tris) -> bool:
+		# Meshes below the triangle threshold can never qualify; reject them
+		# from the tag hint without paying for a package load.
+		return not (0 <= tag_tris < tri_threshold)
+
+	for rec in _mesh_scan.scan_meshes(SEARCH_PATHS, predicate=keep, want_nanite=True):
 		# Skip if tri count unknown or below threshold
-		if tri_count < 0 or tri_count < tri_threshold:
+		if rec.triangle_count < 0 or rec.triangle_count < tri_threshold:
 			continue
-		if is_unreduced(pct_raw, unreduced_min_raw):
-			results.append(MeshInfo(
-				name=name,
-				package_path=sm.get_path_name(),
-				triangle_count=tri_count,
-				percent_raw=pct_raw if pct_raw is not None else 1.0,
-				nanite_enabled=nanite_state,
-				asset=sm,
-			))
+		if is_unreduced(rec.percent_raw, unreduced_min_raw):
+			mi = MeshInfo(
+				name=rec.name,
+				package_path=rec.package_path,
+				triangle_count=rec.triangle_count,
+				percent_raw=rec.percent_raw if rec.percent_raw is not None else 1.0,
+				nanite_enabled=rec.nanite_enabled,
+				asset=rec.asset,
+			)
+			if on_candidate is not None:
+				on_candidate(mi)
+			results.append(mi)
 	return results
 
 
 def format_table(rows: List[List[str]]) -> str:
-	# dynamic width: use configured width but allow bigger if content longer
-	col_widths = []
-	for idx, (header, default_w) in enumerate(COLS):
-		max_content = max([len(r[idx]) for r in rows] + [len(header)]) if rows else len(header)
-		col_widths.append(max(default_w, max_content))
-	header_line = ' '.join(h.ljust(col_widths[i]) for i, (h, _) in enumerate(COLS))
-	sep_line = ' '.join('-' * col_widths[i] for i in range(len(COLS)))
-	body_lines = [' '.join(r[i].ljust(col_widths[i]) for i in range(len(COLS))) for r in rows]
+	# One pass over all cells to find widths (configured width is the floor),
+	# instead of a max() comprehension per column.
+	widths = [len(h) for h, _ in COLS]
+	for r in rows:
+		for i, cell in enumerate(r):
+			if len(cell) > widths[i]:
+				widths[i] = len(cell)
+	widths = [max(w, default_w) for w, (_, default_w) in zip(widths, COLS)]
+	header_line = ' '.join(h.ljust(widths[i]) for i, (h, _) in enumerate(COLS))
+	sep_line = ' '.join('-' * w for w in widths)
+	body_lines = [' '.join(cell.ljust(widths[i]) for i, cell in enumerate(r)) for r in rows]
 	return '\n'.join([header_line, sep_line] + body_lines)
 
 
-def write_csv(meshes: List[MeshInfo], csv_path: str):
+def open_csv_writer(csv_path: str):
+	"""Open the CSV and write the header; rows stream in during the scan.
+
+	Streaming per candidate keeps memory bounded (no full report buffered) and
+	leaves partial output on disk if a huge scan is interrupted.
+	"""
 	import csv
 	os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-	with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-		writer = csv.writer(f)
-		writer.writerow(["TriangleCount", "PercentRaw", "PercentUI", "Nanite", "AssetName", "PackagePath"])
-		for m in meshes:
-			writer.writerow([
-				m.triangle_count,
-				f"{m.percent_raw:.6f}",
-				f"{m.percent_ui:.2f}",
-				'EN' if m.nanite_enabled else 'DIS',
-				m.name,
-				m.package_path,
-			])
+	f = open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+	writer = csv.writer(f)
+	writer.writerow(["TriangleCount", "PercentRaw", "PercentUI", "Nanite", "AssetName", "PackagePath"])
+	return f, writer
+
+
+def csv_row(m: MeshInfo):
+	return [
+		m.triangle_count,
+		f"{m.percent_raw:.6f}",
+		f"{m.percent_ui:.2f}",
+		'EN' if m.nanite_enabled else 'DIS',
+		m.name,
+		m.package_path,
+	]
+
+
+# Per-asset fallback spawns one synchronous editor tab per call, which stalls
+# the editor UI; cap it so a missing bulk API can never queue dozens of tabs.
+FALLBACK_OPEN_CAP = 5
 
 
 def _open_assets(meshes: List[MeshInfo], count: int):
@@ -237,13 +186,16 @@ def _open_assets(meshes: List[MeshInfo], count: int):
 	if not meshes:
 		return
 	to_open = meshes[: min(count, len(meshes))]
-	assets = [m.asset for m in to_open]
+	# attrgetter runs in C; marginal here, but this can be a 50+ element list
+	assets = list(map(attrgetter('asset'), to_open))
 	try:
 		editor_sub = unreal.get_editor_subsystem(unreal.AssetEditorSubsystem)
 		# Use bulk open if available
 		if hasattr(editor_sub, 'open_editor_for_assets'):
 			editor_sub.open_editor_for_assets(assets)
 		else:
+			_log(f"Bulk open_editor_for_assets unavailable; opening at most {FALLBACK_OPEN_CAP} assets one at a time to avoid stalling the editor")
+			assets = assets[:FALLBACK_OPEN_CAP]
 			for a in assets:
 				editor_sub.open_editor_for_asset(a)
 		_log(f"Opened {len(assets)} assets (top {count} by triangle count)")
@@ -253,7 +205,40 @@ def _open_assets(meshes: List[MeshInfo], count: int):
 
 def run(tri_threshold: int = TRIANGLE_THRESHOLD, unreduced_min_raw: float = UNREDUCED_MIN_RAW, csv: Optional[str] = None, limit: Optional[int] = None, open_top: Optional[int] = OPEN_TOP_DEFAULT):
 	_log(f"Scanning StaticMesh assets (threshold={tri_threshold} unreduced_min_raw={unreduced_min_raw} open_top={open_top})")
-	meshes = collect_candidates(tri_threshold, unreduced_min_raw)
+	# Resolve relative path based on current working directory (usually project root when launched via editor)
+	csv_path = os.path.abspath(csv) if csv else None
+	csv_file = None
+	csv_writer = None
+	if csv_path:
+		try:
+			csv_file, csv_writer = open_csv_writer(csv_path)
+		except Exception as e:
+			_log(f"Failed to open CSV '{csv_path}': {e}")
+			csv_file = csv_writer = None
+	keep_assets = open_top is not None and open_top > 0
+
+	def on_candidate(m: MeshInfo):
+		nonlocal csv_file, csv_writer
+		if csv_writer is not None:
+			try:
+				csv_writer.writerow(csv_row(m))
+			except Exception as e:
+				# A disk-full/permission error mid-stream must not abort the
+				# scan: drop the CSV (logged once) and keep the table and
+				# open-top phases.
+				_log(f"CSV write failed ({e}); continuing without CSV")
+				csv_writer = None
+				try:
+					csv_file.close()
+				except Exception:
+					pass
+				csv_file = None
+		if not keep_assets:
+			# Scan-only mode: drop the UObject reference so the mesh is not
+			# pinned in memory for the rest of the run.
+			m.asset = None
+
+	meshes = collect_candidates(tri_threshold, unreduced_min_raw, on_candidate=on_candidate)
 	meshes.sort(key=lambda m: m.triangle_count, reverse=True)
 	_log(f"Found {len(meshes)} unreduced meshes >= {tri_threshold} triangles")
 	display = meshes if limit is None else meshes[:limit]
@@ -263,11 +248,9 @@ def run(tri_threshold: int = TRIANGLE_THRESHOLD, unreduced_min_raw: float = UNRE
 		unreal.log(line)
 	if limit is not None and len(meshes) > limit:
 		_log(f"(Showing first {limit} of {len(meshes)}; use --limit=<n> to change or omit to show all)")
-	if csv:
-		# Resolve relative path based on current working directory (usually project root when launched via editor)
-		csv_path = os.path.abspath(csv)
+	if csv_file is not None:
 		try:
-			write_csv(meshes, csv_path)
+			csv_file.close()
 			_log(f"CSV written: {csv_path}")
 		except Exception as e:
 			_log(f"Failed to write CSV '{csv_path}': {e}")
@@ -0,0 +1,259 @@
+"""
+_mesh_scan
+==========
+
+Shared StaticMesh scan for OverReducedFinder, TrianglesListMaker and
+percenttriangles.
+
+The tools walk the same /Game StaticMesh set and read the same LOD0
+triangle count + reduction percent, so the registry query, tag parsing and
+property accessors live here and each tool only supplies its own cheap
+filter predicate. Running several tools in one session therefore shares one
+code path (and one set of cached subsystem handles) instead of two copies.
+
+Tested / written for Unreal Engine 5.6 Python API (should work on most 5.x versions).
+"""
+
+from __future__ import annotations
+import unreal
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+import re
+
+CLASS_NAMES = ["StaticMesh"]
+RECURSIVE_PATHS = True
+RECURSIVE_CLASSES = True
+
+# Cached handles: each unreal.get_editor_subsystem / get_asset_registry call
+# crosses the Python/UE reflection boundary, so resolve them once per session.
+_REGISTRY = None
+_SMES = None
+
+
+def get_asset_registry():
+	global _REGISTRY
+	if _REGISTRY is None:
+		_REGISTRY = unreal.AssetRegistryHelpers.get_asset_registry()
+	return _REGISTRY
+
+
+def get_smes():
+	global _SMES
+	if _SMES is None:
+		_SMES = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+	return _SMES
+
+
+@dataclass(slots=True)
+class MeshRecord:
+	"""One scanned StaticMesh: AssetData plus the properties both tools need."""
+	asset_data: unreal.AssetData
+	name: str
+	package_path: str
+	triangle_count: int              # LOD0; -1 if unknown
+	percent_raw: Optional[float]     # LOD0 reduction percent, raw 0..1
+	nanite_enabled: bool
+	asset: unreal.StaticMesh
+
+
+def get_static_mesh_asset_data(package_paths: List[str]) -> Iterable[unreal.AssetData]:
+	"""Return raw AssetData for every StaticMesh under the given paths.
+
+	Deliberately does NOT call get_asset(): materializing a StaticMesh forces a
+	full package load (disk I/O + UObject construction). Callers should filter
+	on the cheap AssetData fields / registry tags first and only load survivors.
+	"""
+	registry = get_asset_registry()
+	ar_filter = unreal.ARFilter(
+		class_names=CLASS_NAMES,
+		recursive_paths=RECURSIVE_PATHS,
+		recursive_classes=RECURSIVE_CLASSES,
+		package_paths=package_paths,
+		include_only_on_disk_assets=False,
+	)
+	return registry.get_assets(ar_filter)
+
+
+# "LODs" tag payload looks like "(NumLODs=4,Triangles=(123,45,12,6),...)";
+# the first number after "Triangles=(" is the LOD0 count.
+_LODS_TRIANGLES_RE = re.compile(r"Triangles=\((\d+)")
+
+
+def get_triangle_count_from_tag(ad: unreal.AssetData) -> int:
+	"""Cheap LOD0 triangle count straight from asset-registry tags (no load).
+
+	Tries the plain "Triangles" tag first, then parses the "LODs" tag.
+	Returns -1 if neither tag is usable; callers must then fall back to the
+	loaded-asset path.
+	"""
+	try:
+		val = ad.get_tag_value("Triangles")
+		if val:
+			return int(str(val))
+	except Exception:
+		pass
+	try:
+		val = ad.get_tag_value("LODs")
+		if val:
+			m = _LODS_TRIANGLES_RE.search(str(val))
+			if m:
+				return int(m.group(1))
+	except Exception:
+		pass
+	return -1
+
+
+def _pct_via_lods(static_mesh: unreal.StaticMesh) -> Optional[float]:
+	try:
+		lods = static_mesh.get_editor_property("lods")
+		if lods:
+			red = lods[0].get_editor_property("reduction_settings")
+			return float(red.percent_triangles)
+	except Exception:
+		pass
+	return None
+
+
+def _pct_via_source_models(static_mesh: unreal.StaticMesh) -> Optional[float]:
+	try:
+		source_models = static_mesh.get_editor_property("source_models")
+		if source_models:
+			red = source_models[0].get_editor_property("reduction_settings")
+			return float(red.percent_triangles)
+	except Exception:
+		pass
+	return None
+
+
+def _pct_via_subsystem(static_mesh: unreal.StaticMesh) -> Optional[float]:
+	try:
+		settings = get_smes().get_lod_reduction_settings(static_mesh, 0)
+		if settings:
+			return float(settings.percent_triangles)
+	except Exception:
+		pass
+	return None
+
+
+# Which accessor strategy worked last. On a given engine version the same
+# path wins every time, so once probed the winner is tried first and the
+# failing attempts (plus their swallowed exceptions) are no longer paid per
+# mesh.
+_PCT_READ_STRATEGIES = (_pct_via_lods, _pct_via_source_models, _pct_via_subsystem)
+_pct_read_winner: Optional[int] = None
+
+
+def get_percent_triangles_lod0(static_mesh: unreal.StaticMesh) -> Optional[float]:
+	"""Return RAW (0-1) PercentTriangles for LOD0 reduction settings, or None."""
+	global _pct_read_winner
+	if _pct_read_winner is not None:
+		val = _PCT_READ_STRATEGIES[_pct_read_winner](static_mesh)
+		if val is not None:
+			return val
+		# memoized path stopped working; fall through to the full probe
+	for idx, strategy in enumerate(_PCT_READ_STRATEGIES):
+		val = strategy(static_mesh)
+		if val is not None:
+			_pct_read_winner = idx
+			return val
+	return None
+
+
+# Bound once: unreal.StaticMesh attribute lookup goes through the unreal
+# module's __getattr__ on some engine builds, so don't pay it per asset. The
+# ARFilter already restricts to StaticMesh; the isinstance check just guards
+# against redirectors and failed loads.
+_STATIC_MESH = unreal.StaticMesh
+
+# Probed once against the class: hasattr on UE-wrapped objects walks the
+# reflected property table on every call.
+_HAS_GET_NUM_TRIANGLES = hasattr(_STATIC_MESH, 'get_num_triangles')
+_HAS_IS_NANITE = hasattr(_STATIC_MESH, 'is_nanite_enabled')
+
+
+def get_lod0_triangle_count(static_mesh: unreal.StaticMesh) -> int:
+	if _HAS_GET_NUM_TRIANGLES:
+		try:
+			return int(static_mesh.get_num_triangles(0))
+		except Exception:
+			pass
+	# Fallback attempt via editor data (less reliable)
+	try:
+		render_data = static_mesh.get_editor_property('render_data') if hasattr(static_mesh, 'get_editor_property') else None
+		if render_data and hasattr(render_data, 'lods'):
+			lods = getattr(render_data, 'lods', [])
+			if lods:
+				lod0 = lods[0]
+				if hasattr(lod0, 'get_num_triangles'):
+					return int(lod0.get_num_triangles())
+	except Exception:
+		pass
+	return -1  # unknown
+
+
+def get_nanite_enabled(static_mesh: unreal.StaticMesh) -> bool:
+	# On UE 5.x is_nanite_enabled always exists; branching on the one-time
+	# class probe keeps the per-mesh try/except out of the hot scan loop.
+	if _HAS_IS_NANITE:
+		return bool(static_mesh.is_nanite_enabled())
+	# fallback older property path
+	try:
+		nanite_settings = static_mesh.get_editor_property('nanite_settings')
+		if nanite_settings:
+			return bool(getattr(nanite_settings, 'enabled', False))
+	except Exception:
+		pass
+	return False
+
+
+def scan_meshes(
+	package_paths: List[str],
+	predicate: Optional[Callable[[unreal.AssetData, int], bool]] = None,
+	bulk_path_filter: Optional[Callable[[List[str]], Iterable[int]]] = None,
+	want_nanite: bool = False,
+) -> Iterable[MeshRecord]:
+	"""Yield a MeshRecord per StaticMesh that survives the cheap filters.
+
+	predicate(ad, tag_tris) runs per AssetData BEFORE any package load;
+	bulk_path_filter maps the full package-path list to the surviving indices
+	(lets callers run one precompiled matcher over plain strings). The filter
+	phase touches only AssetData fields and registry tags; FName->str package
+	paths are only marshalled at all when a bulk path filter asks for them.
+	Only survivors are materialized via get_asset().
+	"""
+	assets = list(get_static_mesh_asset_data(package_paths))
+	if bulk_path_filter:
+		indices = bulk_path_filter([str(ad.package_name) for ad in assets])
+	else:
+		indices = range(len(assets))
+	for idx in indices:
+		ad = assets[idx]
+		tag_tris = get_triangle_count_from_tag(ad)
+		if predicate is not None and not predicate(ad, tag_tris):
+			continue
+
+		# Only materialize the survivors.
+		try:
+			sm = ad.get_asset()
+		except Exception:
+			continue
+		if not isinstance(sm, _STATIC_MESH):
+			continue
+
+		# Tag already gave us the count; only fall back to the loaded-asset
+		# round-trip when the tag was missing.
+		tri_count = tag_tris if tag_tris >= 0 else get_lod0_triangle_count(sm)
+		# AssetData already carries name/path as plain FNames; converting
+		# those skips two UObject reflection calls (get_name/get_path_name)
+		# per mesh. "<package>.<asset>" matches get_path_name() for on-disk
+		# assets.
+		name = str(ad.asset_name)
+		yield MeshRecord(
+			asset_data=ad,
+			name=name,
+			package_path=f"{ad.package_name}.{name}",
+			triangle_count=tri_count,
+			percent_raw=get_percent_triangles_lod0(sm),
+			nanite_enabled=get_nanite_enabled(sm) if want_nanite else False,
+			asset=sm,
+		)
@@ -31,6 +31,9 @@ Adjust TARGET_PERCENT_UI or NAME_TOKEN below as needed. Tolerances (EPS_UI/EPS_R
 
 from __future__ import annotations
 import unreal
+import _mesh_scan
+from collections import Counter, deque
+from enum import IntEnum
 from typing import List, Tuple
 
 # Configurable constants
@@ -59,45 +62,147 @@ INTROSPECT_MAX_DEPTH = 3          # recursion depth for debug dump
 INTROSPECT_MAX_CHILDREN = 40      # limit per object to avoid log spam
 INTROSPECT_INCLUDE_PRIVATE = False
 
+# When False, process_mesh skips building its long per-mesh report strings
+# (changed / would-change lines) and run() logs nothing for them. Skip and
+# error messages are always produced; they are short and the summary
+# counting depends on them.
+VERBOSE_LOGGING = True
+
 
 def _log(msg: str):
 	unreal.log(f"[percenttriangles] {msg}")
 
 
-def find_static_meshes_with_token(token: str) -> List[unreal.StaticMesh]:
-	registry = unreal.AssetRegistryHelpers.get_asset_registry()
-	filter = unreal.ARFilter(
-		class_names=["StaticMesh"],
+class Status(IntEnum):
+	"""Outcome of process_mesh for one candidate; _run_batch bins on these
+	instead of scanning the human-readable message text."""
+	CHANGED = 0
+	SKIPPED = 1
+	ERROR = 2
+	ALREADY = 3
+
+
+# The registry/subsystem handle caches and the registry-tag triangle parser
+# live in _mesh_scan, shared with OverReducedFinder and TrianglesListMaker;
+# local aliases keep this module's call sites unchanged.
+_get_asset_registry = _mesh_scan.get_asset_registry
+_smes = _mesh_scan.get_smes
+_tag_triangle_count = _mesh_scan.get_triangle_count_from_tag
+
+
+# Unbound FName->str converter, probed once; find_static_mesh_asset_data_
+# with_token falls back to plain str() when the engine build lacks it.
+_NAME_TO_STRING = getattr(unreal.Name, 'to_string', None)
+
+
+def _static_mesh_ar_filter() -> unreal.ARFilter:
+	"""Registry filter for StaticMesh assets under /Game.
+
+	Prefers class_paths (the indexed, non-deprecated form) so the registry
+	takes its fast path; falls back to class_names on engines without
+	TopLevelAssetPath.
+	"""
+	common = dict(
 		recursive_classes=True,
 		recursive_paths=True,
 		include_only_on_disk_assets=False,
 		package_paths=["/Game"],  # limit to game content; adjust if needed
 	)
-	assets = registry.get_assets(filter)
-	matches: List[unreal.StaticMesh] = []
-	for a in assets:
-		# asset_name is an FName (unreal.Name). Cast to str for substring test.
-		name_str = str(a.asset_name)
-		if token in name_str:
-			sm = a.get_asset()
-			if isinstance(sm, unreal.StaticMesh):
-				matches.append(sm)
-	return matches
+	try:
+		return unreal.ARFilter(
+			class_paths=[unreal.TopLevelAssetPath("/Script/Engine", "StaticMesh")],
+			**common,
+		)
+	except Exception:
+		return unreal.ARFilter(class_names=["StaticMesh"], **common)
 
 
-def get_percent_triangles_lod0(static_mesh: unreal.StaticMesh) -> float | None:
-	"""Return RAW (0-1) PercentTriangles for LOD0 reduction settings, or None if unavailable."""
-	# In UE5, reduction settings are per LOD. Use get_editor_property
-	# 1) Direct LOD struct property access
+def find_static_mesh_asset_data_with_token(token: str) -> List[unreal.AssetData]:
+	"""Return AssetData for every StaticMesh whose name contains token.
+
+	Pure registry work: the name filter runs over AssetData only (asset_name
+	is an FName; cast to str once per asset) and nothing here touches the
+	package on disk. Loading is deferred to the caller so meshes that get
+	skipped on cheap checks are never paged in.
+	"""
+	registry = _get_asset_registry()
+	assets = registry.get_assets(_static_mesh_ar_filter())
+	# The FName->str marshal is the floor for a substring match — FName has
+	# no cheap contains primitive — so make sure it is the only per-asset
+	# cost. The unbound Name.to_string (probed once at import) skips the
+	# str() dispatch through the type's __str__ slot and, bound to a local,
+	# the per-iteration lookups too: the loop body is one direct call per
+	# asset. token is already a local.
+	to_str = _NAME_TO_STRING or str
+	return [a for a in assets if token in to_str(a.asset_name)]
+
+
+def find_static_meshes_with_token(token: str) -> List[unreal.StaticMesh]:
+	# Materialize every name match — get_asset() force-loads the whole
+	# package, so callers that can filter further should prefer the
+	# AssetData variant above. The class filter already guarantees
+	# StaticMesh, so only failed loads are dropped.
+	loaded = [a.get_asset() for a in find_static_mesh_asset_data_with_token(token)]
+	return [sm for sm in loaded if sm is not None]
+
+
+def _below_cutoff(tri_count: int) -> bool:
+	return TRIANGLE_CUTOFF > 0 and 0 <= tri_count <= TRIANGLE_CUTOFF
+
+
+def _prefetch_assets(assets_data: List[unreal.AssetData]):
+	"""Load the surviving batch up front, purely for operator feedback.
+
+	get_asset() is a synchronous load that completes before returning, so
+	looping over it here overlaps no IO and costs the same in total as
+	loading lazily from process_mesh. What the pass buys is a visible,
+	correctly sized ScopedSlowTask over the expensive load phase, instead
+	of the editor appearing hung partway into the mutate loop. Loaded
+	packages are cached, so the later get_asset() in process_mesh is a
+	lookup, not a load. (Fanning the loads out to Python worker threads is
+	not an option: UObject loading must stay on the game thread.)
+	"""
+	if not assets_data:
+		return
+	with unreal.ScopedSlowTask(len(assets_data), "Loading candidate meshes") as task:
+		task.make_dialog(True)
+		for ad in assets_data:
+			task.enter_progress_frame(1)
+			try:
+				ad.get_asset()
+			except Exception:
+				pass  # process_mesh reports the load failure per mesh
+
+
+# In UE5, reduction settings are per LOD and different engine versions
+# expose different access paths. Each path below is one strategy; the
+# subsystem ones come first because they marshal only the small
+# FStaticMeshReductionSettings struct, while the lods/source_models paths
+# copy the whole source-model array across the Python boundary just to
+# touch one field.
+
+def _pct_read_via_subsystem(static_mesh: unreal.StaticMesh) -> float | None:
+	try:
+		settings = _smes().get_lod_reduction_settings(static_mesh, 0)
+		if settings:
+			return float(settings.percent_triangles)
+	except Exception:
+		pass
+	return None
+
+
+def _pct_read_via_lods(static_mesh: unreal.StaticMesh) -> float | None:
 	try:
 		lods = static_mesh.get_editor_property("lods")
 		if lods:
-			lod0 = lods[0]
-			red = lod0.get_editor_property("reduction_settings")
+			red = lods[0].get_editor_property("reduction_settings")
 			return float(red.percent_triangles)
 	except Exception:
 		pass
-	# 2) source_models path
+	return None
+
+
+def _pct_read_via_source_models(static_mesh: unreal.StaticMesh) -> float | None:
 	try:
 		source_models = static_mesh.get_editor_property("source_models")
 		if source_models:
@@ -105,52 +210,123 @@ def get_percent_triangles_lod0(static_mesh: unreal.StaticMesh) -> float | None:
 			return float(red.percent_triangles)
 	except Exception:
 		pass
-	# 3) StaticMeshEditorSubsystem reduction settings (if available)
+	return None
+
+
+# Which strategy worked last. On a given engine version the same path wins
+# every time, so once probed the winner runs first and the failing attempts
+# (plus their raised-and-swallowed exceptions, which editor-property access
+# produces liberally) are no longer paid per mesh.
+_PCT_READ_STRATEGIES = (_pct_read_via_subsystem, _pct_read_via_lods, _pct_read_via_source_models)
+_pct_read_winner: int | None = None
+
+
+def get_percent_triangles_lod0(static_mesh: unreal.StaticMesh) -> float | None:
+	"""Return RAW (0-1) PercentTriangles for LOD0 reduction settings, or None if unavailable."""
+	global _pct_read_winner
+	if _pct_read_winner is not None:
+		val = _PCT_READ_STRATEGIES[_pct_read_winner](static_mesh)
+		if val is not None:
+			return val
+		# memoized path stopped working; fall through to the full probe
+	for idx, strategy in enumerate(_PCT_READ_STRATEGIES):
+		val = strategy(static_mesh)
+		if val is not None:
+			_pct_read_winner = idx
+			return val
+	return None
+
+
+def _pct_write_via_subsystem(static_mesh: unreal.StaticMesh, value_raw: float) -> bool:
 	try:
-		smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+		smes = _smes()
 		settings = smes.get_lod_reduction_settings(static_mesh, 0)
 		if settings:
-			return float(settings.percent_triangles)
+			settings.set_editor_property("percent_triangles", value_raw)
+			smes.set_lod_reduction_settings(static_mesh, 0, settings)
+			return True
 	except Exception:
 		pass
-	return None
+	return False
 
 
-def set_percent_triangles_lod0(static_mesh: unreal.StaticMesh, value_raw: float) -> bool:
-	# 1) Direct LOD path
+# The two struct paths write the inner reduction struct in place and only
+# round-trip the outer array through set_editor_property when a read-back
+# shows the in-place write landed on a detached copy; re-assigning the
+# whole array marshals every LOD's source model across the Python boundary
+# per call. The read-back must come from the mesh itself — re-reading the
+# local array object would just see our own mutation and "pass" even when
+# the mesh never changed. static_mesh.modify() snapshots the pre-change
+# state into the open transaction, so it has to run before the first
+# mutating write or undo would restore nothing.
+
+def _pct_write_via_lods(static_mesh: unreal.StaticMesh, value_raw: float) -> bool:
 	try:
 		lods = static_mesh.get_editor_property("lods")
 		if lods:
 			lod0 = lods[0]
 			red = lod0.get_editor_property("reduction_settings")
+			static_mesh.modify()
 			red.set_editor_property("percent_triangles", value_raw)
 			lod0.set_editor_property("reduction_settings", red)
-			static_mesh.set_editor_property("lods", lods)
+			check = static_mesh.get_editor_property("lods")[0].get_editor_property("reduction_settings")
+			if abs(float(check.percent_triangles) - value_raw) > EPS_RAW:
+				# In-place write was on a copy; fall back to the full array
+				# round-trip.
+				static_mesh.set_editor_property("lods", lods)
 			return True
 	except Exception:
 		pass
-	# 2) source_models path
+	return False
+
+
+def _pct_write_via_source_models(static_mesh: unreal.StaticMesh, value_raw: float) -> bool:
 	try:
 		source_models = static_mesh.get_editor_property("source_models")
 		if source_models:
 			red = source_models[0].get_editor_property("reduction_settings")
+			static_mesh.modify()
 			red.set_editor_property("percent_triangles", value_raw)
 			source_models[0].set_editor_property("reduction_settings", red)
-			static_mesh.set_editor_property("source_models", source_models)
+			check = static_mesh.get_editor_property("source_models")[0].get_editor_property("reduction_settings")
+			if abs(float(check.percent_triangles) - value_raw) > EPS_RAW:
+				static_mesh.set_editor_property("source_models", source_models)
 			return True
 	except Exception:
 		pass
-	# 3) StaticMeshEditorSubsystem API
-	try:
-		smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
-		settings = smes.get_lod_reduction_settings(static_mesh, 0)
-		if settings:
-			settings.set_editor_property("percent_triangles", value_raw)
-			smes.set_lod_reduction_settings(static_mesh, 0, settings)
+	return False
+
+
+_PCT_WRITE_STRATEGIES = (_pct_write_via_subsystem, _pct_write_via_lods, _pct_write_via_source_models)
+_pct_write_winner: int | None = None
+
+
+def set_percent_triangles_lod0(static_mesh: unreal.StaticMesh, value_raw: float) -> bool:
+	global _pct_write_winner
+	if _pct_write_winner is not None:
+		if _PCT_WRITE_STRATEGIES[_pct_write_winner](static_mesh, value_raw):
+			return True
+		# memoized path stopped working; fall through to the full probe
+	for idx, strategy in enumerate(_PCT_WRITE_STRATEGIES):
+		if strategy(static_mesh, value_raw):
+			_pct_write_winner = idx
 			return True
+	_log(f"Failed to set percent triangles on {static_mesh.get_name()}: no writable path")
+	return False
+
+
+def _nanite_enabled(static_mesh: unreal.StaticMesh) -> bool:
+	"""Read-only Nanite probe; never dirties the mesh."""
+	try:
+		return bool(static_mesh.is_nanite_enabled())
+	except AttributeError:
+		pass
+	try:
+		nanite_settings = static_mesh.get_editor_property("nanite_settings")
+		if nanite_settings:
+			return bool(getattr(nanite_settings, "enabled", False))
 	except Exception:
 		pass
-	_log(f"Failed to set percent triangles on {static_mesh.get_name()}: no writable path")
 	return False
 
 
@@ -190,210 +366,380 @@ def ensure_nanite_disabled(static_mesh: unreal.StaticMesh) -> tuple[bool, bool,
 	return was_enabled, is_enabled_after, changed
 
 
-def build_and_save(static_mesh: unreal.StaticMesh):
-	smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
-	# Different engine versions expose different build APIs; try several.
-	build_ok = False
-	# 1) rebuild_lods (newer API in some branches)
+# Meshes whose percent changed this run; their LOD rebuilds run as one
+# batched pass after the main loop so per-mesh editor notification overhead
+# is paid once.
+_pending_builds: List[unreal.StaticMesh] = []
+
+# Packages dirtied this run; saved with one save_packages call at the end of
+# the batch instead of flushing each mesh to disk individually.
+_pending_packages: List[unreal.Package] = []
+
+
+def flush_pending_builds():
+	"""Rebuild LODs for every queued mesh, batched where the engine allows."""
+	global _pending_builds
+	if not _pending_builds:
+		return
+	meshes = _pending_builds
+	_pending_builds = []
+	smes = _smes()
+	with unreal.ScopedSlowTask(len(meshes), "Rebuilding LODs") as task:
+		task.make_dialog(True)
+		if hasattr(smes, 'build_static_meshes'):
+			try:
+				smes.build_static_meshes(meshes)
+				task.enter_progress_frame(len(meshes))
+				for sm in meshes:
+					_pending_packages.append(sm.get_outer())
+				return
+			except Exception as e:
+				_log(f"Warning: batched build_static_meshes failed ({e}); falling back to per-mesh builds")
+		for sm in meshes:
+			task.enter_progress_frame(1)
+			build_only(sm)
+
+
+def flush_pending_saves():
+	"""Save every queued package in a single batched save_packages call."""
+	global _pending_packages
+	if not _pending_packages:
+		return
+	packages = _pending_packages
+	_pending_packages = []
 	try:
-		if hasattr(smes, 'rebuild_lods'):
-			smes.rebuild_lods(static_mesh)
-			build_ok = True
+		unreal.EditorLoadingAndSavingUtils.save_packages(packages, only_dirty=True)
+		_log(f"Saved {len(packages)} packages in one batch")
+		return
 	except Exception as e:
-		_log(f"Warning: rebuild_lods failed on {static_mesh.get_name()}: {e}")
-	# 2) build static mesh (generic)
-	if not build_ok:
+		_log(f"Warning: batched save_packages failed ({e}); falling back to per-asset saves")
+	# The batch call may have failed because the API itself is missing, so
+	# the fallback must not retry it per package; go through
+	# EditorAssetLibrary instead (the package name is the asset path for
+	# these single-asset packages).
+	for package in packages:
 		try:
-			if hasattr(smes, 'build_static_mesh'):
-				smes.build_static_mesh(static_mesh)
-				build_ok = True
+			unreal.EditorAssetLibrary.save_asset(package.get_name(), only_if_is_dirty=True)
 		except Exception as e:
-			_log(f"Warning: build_static_mesh failed on {static_mesh.get_name()}: {e}")
-	# 3) Fallback: call build from asset if available
-	if not build_ok:
+			_log(f"Warning: save failed for {package.get_name()}: {e}")
+
+
+# Per-mesh build API, resolved once: different engine versions expose
+# different build entry points, but which ones exist is a property of the
+# session, not of the mesh — so the hasattr probes (which walk the
+# reflected function table) run once instead of per mesh. Lazy because the
+# subsystem handle should not be resolved at import time.
+_build_fn = None
+_build_fn_resolved = False
+
+# Probed against the class, not per instance: sometimes exists.
+_HAS_MESH_BUILD = hasattr(unreal.StaticMesh, 'build')
+
+
+def _resolve_build_fn():
+	global _build_fn, _build_fn_resolved
+	if not _build_fn_resolved:
+		_build_fn_resolved = True
+		smes = _smes()
+		if hasattr(smes, 'rebuild_lods'):  # newer API in some branches
+			_build_fn = smes.rebuild_lods
+		elif hasattr(smes, 'build_static_mesh'):  # generic
+			_build_fn = smes.build_static_mesh
+	return _build_fn
+
+
+def build_only(static_mesh: unreal.StaticMesh):
+	build_fn = _resolve_build_fn()
+	build_ok = False
+	if build_fn is not None:
 		try:
-			if hasattr(static_mesh, 'build'):  # sometimes exists
-				static_mesh.build()
-				build_ok = True
+			build_fn(static_mesh)
+			build_ok = True
+		except Exception as e:
+			_log(f"Warning: {build_fn.__name__} failed on {static_mesh.get_name()}: {e}")
+	# Fallback: call build from asset if available
+	if not build_ok and _HAS_MESH_BUILD:
+		try:
+			static_mesh.build()
+			build_ok = True
 		except Exception as e:
 			_log(f"Warning: static_mesh.build() failed on {static_mesh.get_name()}: {e}")
 	if not build_ok:
 		_log(f"Warning: No LOD rebuild method succeeded for {static_mesh.get_name()} (may still save with new settings)")
-	package = static_mesh.get_outer()  # UPackage
-	# Save asset (API differences across versions)
-	try:
-		unreal.EditorAssetLibrary.save_loaded_asset(static_mesh)
-	except Exception as e:
-		_log(f"Warning: save_loaded_asset failed for {static_mesh.get_name()}: {e}")
-	# Attempt broader package save via EditorLoadingAndSavingUtils if available
-	try:
-		if hasattr(unreal, 'EditorLoadingAndSavingUtils'):
-			unreal.EditorLoadingAndSavingUtils.save_packages([package], only_dirty=True)
-	except Exception as e:
-		_log(f"Warning: save_packages fallback failed for {static_mesh.get_name()}: {e}")
-
-
-def process_mesh(static_mesh: unreal.StaticMesh, dry_run: bool = True) -> Tuple[bool, str]:
-	name = static_mesh.get_name()
+	# Queue the dirty package; flush_pending_saves() writes the whole batch
+	# at the end of the run.
+	_pending_packages.append(static_mesh.get_outer())  # UPackage
+
+
+def process_mesh(asset_data: unreal.AssetData, dry_run: bool = True, verbose: bool = VERBOSE_LOGGING) -> Tuple[Status, str]:
+	name = str(asset_data.asset_name)
+	# Cheap checks first, against registry tags only: a mesh rejected here is
+	# never loaded at all. The percent checks below unavoidably need the
+	# loaded asset (reduction settings are not exported as a registry tag).
+	tri_count = _tag_triangle_count(asset_data)
+	if _below_cutoff(tri_count):
+		return Status.SKIPPED, f"{name}: Skipped (triangles {tri_count} <= cutoff {TRIANGLE_CUTOFF})"
+	static_mesh = asset_data.get_asset()
+	if static_mesh is None:
+		return Status.ERROR, f"{name}: Failed to load asset"
 	percent_raw = get_percent_triangles_lod0(static_mesh)
 	if percent_raw is None:
-		return False, f"{name}: Could not read LOD0 percent triangles"
+		return Status.ERROR, f"{name}: Could not read LOD0 percent triangles"
 	percent_ui = percent_raw * 100.0
-	# Triangle count acquisition (LOD0). If fails, tri_count becomes -1 and we proceed (unless cutoff enabled).
-	tri_count = -1
-	try:
-		# Most engine versions support get_num_triangles(lod_index)
-		if hasattr(static_mesh, 'get_num_triangles'):
-			tri_count = static_mesh.get_num_triangles(0)
-	except Exception:
-		pass
-	was_nanite, is_nanite_after, nanite_changed = ensure_nanite_disabled(static_mesh)
+	# Tag missing: fall back to the loaded-asset triangle count so the cutoff
+	# and log lines still work. If that fails too, tri_count stays -1 and we
+	# proceed (unless cutoff enabled).
+	if tri_count < 0:
+		try:
+			# Most engine versions support get_num_triangles(lod_index)
+			if hasattr(static_mesh, 'get_num_triangles'):
+				tri_count = static_mesh.get_num_triangles(0)
+		except Exception:
+			pass
+		if _below_cutoff(tri_count):
+			return Status.SKIPPED, f"{name}: Skipped (triangles {tri_count} <= cutoff {TRIANGLE_CUTOFF})"
 	# Already at target (within tolerance)
 	if SKIP_IF_ALREADY_BELOW_TARGET and abs(percent_raw - TARGET_PERCENT_RAW) <= EPS_RAW:
-		return False, f"{name}: Already at target {TARGET_PERCENT_UI}% (raw {percent_raw:.6f})"
-	# Triangle cutoff check
-	if TRIANGLE_CUTOFF > 0 and tri_count >= 0 and tri_count <= TRIANGLE_CUTOFF:
-		return False, f"{name}: Skipped (triangles {tri_count} <= cutoff {TRIANGLE_CUTOFF})"
+		return Status.ALREADY, f"{name}: Already at target {TARGET_PERCENT_UI}% (raw {percent_raw:.6f})"
 	# Percent full-resolution requirement
 	if APPLY_IF_PERCENT_EQ_FULL and abs(percent_raw - ONLY_WHEN_EQUALS_RAW) > EPS_RAW:
-		return False, f"{name}: Skipped (percent {percent_ui:.4f}% raw {percent_raw:.6f} not ~{ONLY_WHEN_EQUALS_UI}%)"
+		return Status.SKIPPED, f"{name}: Skipped (percent {percent_ui:.4f}% raw {percent_raw:.6f} not ~{ONLY_WHEN_EQUALS_UI}%)"
+	# Nanite handling runs only for meshes that passed every skip check:
+	# toggling it dirties the package, which is wasted work (and a spurious
+	# modified flag) on meshes this run never touches. Dry runs probe
+	# read-only instead of toggling, so previewing changes nothing.
 	if dry_run:
-		return True, (
+		was_nanite = _nanite_enabled(static_mesh)
+		is_nanite_after = was_nanite
+		nanite_changed = False
+	else:
+		was_nanite, is_nanite_after, nanite_changed = ensure_nanite_disabled(static_mesh)
+	if dry_run:
+		# The long report line is only worth its allocations when someone
+		# will read it.
+		if not verbose:
+			return Status.CHANGED, ""
+		return Status.CHANGED, (
 			f"{name}: Would change {percent_ui:.4f}% -> {TARGET_PERCENT_UI}% (tris {tri_count}) "
 			f"(raw {percent_raw:.6f}->{TARGET_PERCENT_RAW:.6f}) "
 			f"nanite_before={'EN' if was_nanite else 'DIS'} nanite_after={'EN' if is_nanite_after else 'DIS'} changed={nanite_changed}"
 		)
 
 	if set_percent_triangles_lod0(static_mesh, TARGET_PERCENT_RAW):
-		build_and_save(static_mesh)
-		return True, (
+		_pending_builds.append(static_mesh)
+		if not verbose:
+			return Status.CHANGED, ""
+		return Status.CHANGED, (
 			f"{name}: Changed {percent_ui:.4f}% -> {TARGET_PERCENT_UI}% (tris {tri_count}) "
 			f"(raw {percent_raw:.6f}->{TARGET_PERCENT_RAW:.6f}) "
 			f"nanite_before={'EN' if was_nanite else 'DIS'} nanite_after={'EN' if is_nanite_after else 'DIS'} changed={nanite_changed}"
 		)
 	else:
-		return False, f"{name}: FAILED to apply change (had {percent_ui:.4f}% raw {percent_raw:.6f})"
+		return Status.ERROR, f"{name}: FAILED to apply change (had {percent_ui:.4f}% raw {percent_raw:.6f})"
+
+
+def _push_bulk_scanning():
+	"""Enter the AssetManager bulk-scanning scope if the API exists.
+
+	Returns the AssetManager handle to pass to _pop_bulk_scanning, or None
+	when unavailable. Bulk scanning amortizes per-asset registry bookkeeping
+	(lock/index updates) across the whole batch.
+	"""
+	try:
+		am = unreal.AssetManager.get()
+		if hasattr(am, 'push_bulk_scanning'):
+			am.push_bulk_scanning()
+			return am
+	except Exception:
+		pass
+	return None
+
+
+def _pop_bulk_scanning(am):
+	if am is None:
+		return
+	try:
+		am.pop_bulk_scanning()
+	except Exception as e:
+		_log(f"Warning: pop_bulk_scanning failed: {e}")
 
 
 def run(dry_run: bool = False, diagnose: bool = False, sample_count: int = 3):
 	_log(f"Starting scan (dry_run={dry_run} diagnose={diagnose}) token='{NAME_TOKEN}' target={TARGET_PERCENT_UI}% (raw {TARGET_PERCENT_RAW}) when_equals={ONLY_WHEN_EQUALS_UI}%")
-	meshes = find_static_meshes_with_token(NAME_TOKEN)
-	_log(f"Found {len(meshes)} candidate meshes")
+	# The queues are normally drained by the flush calls, but a batch that
+	# raised mid-run leaves them populated; start clean so a later run in
+	# the same session cannot rebuild/save stale meshes.
+	_pending_builds.clear()
+	_pending_packages.clear()
+	am = _push_bulk_scanning()
+	try:
+		_run_batch(dry_run=dry_run, diagnose=diagnose, sample_count=sample_count)
+	finally:
+		_pop_bulk_scanning(am)
+
+
+def _run_batch(dry_run: bool, diagnose: bool, sample_count: int):
+	assets_data = find_static_mesh_asset_data_with_token(NAME_TOKEN)
+	_log(f"Found {len(assets_data)} candidate meshes")
 	if diagnose:
 		# Print current percents for first few meshes regardless of readability failure
-		for sm in meshes[:sample_count]:
+		for ad in assets_data[:sample_count]:
+			sm = ad.get_asset()
+			if sm is None:
+				continue
 			pct_raw = get_percent_triangles_lod0(sm)
 			pct_ui = None if pct_raw is None else pct_raw * 100.0
 			_log(f"DIAG {sm.get_name()} percent_triangles_raw={pct_raw} ui={pct_ui}")
-		if meshes:
+		if assets_data:
 			_log("Running introspection on first mesh for diagnosis")
 			debug_introspect_first_mesh()
-	changed = 0
-	skipped = 0
-	errors = 0
-	for sm in meshes:
-		ok, message = process_mesh(sm, dry_run=dry_run)
-		if ok:
-			changed += 1
-		else:
-			if "Skipped" in message or "Already" in message:
-				skipped += 1
-			else:
-				errors += 1
-		unreal.log(message)
-	_log(f"Done. changed={changed} skipped={skipped} errors={errors}")
+	# Load everything that will survive the cheap tag cutoff under one
+	# progress dialog before any mesh is mutated (operator feedback only —
+	# see _prefetch_assets). The tag parse repeats in process_mesh, but it
+	# is a short string scan, not a load.
+	_prefetch_assets([ad for ad in assets_data if not _below_cutoff(_tag_triangle_count(ad))])
+	counts: Counter = Counter()
+
+	def _process_all():
+		for ad in assets_data:
+			status, message = process_mesh(ad, dry_run=dry_run)
+			counts[status] += 1
+			if message:
+				unreal.log(message)
+
+	if dry_run:
+		_process_all()
+	else:
+		# One transaction for the whole batch: every property write lands in
+		# a single undo record, instead of each set_editor_property /
+		# set_lod_reduction_settings opening its own transaction and
+		# broadcasting its own notifications. Also makes the run one Ctrl+Z.
+		with unreal.ScopedEditorTransaction("BatchReduceLOD0"):
+			_process_all()
+		# Rebuilds and saves are not undoable edits; keep them outside the
+		# transaction so the undo record stays a pure property delta.
+		flush_pending_builds()
+		flush_pending_saves()
+	_log(
+		f"Done. changed={counts[Status.CHANGED]} skipped={counts[Status.SKIPPED]} "
+		f"already={counts[Status.ALREADY]} errors={counts[Status.ERROR]}"
+	)
 	if dry_run:
 		_log("Dry run complete. Re-run with dry_run=False to apply changes.")
 
 
 # ---------------- Debug / Introspection Utilities ---------------- #
 
-def _safe_dir(obj):
+_INTROSPECT_PREFIX = "[percenttriangles][INTROSPECT]"
+
+
+def _safe_dir(obj, include_private=False):
+	"""dir() with the filtering done at source.
+
+	Dunders are always dropped and _-prefixed names too unless
+	include_private; returning the presorted tuple here means the excluded
+	names are never materialized, re-filtered or re-sorted downstream.
+	"""
 	try:
-		return dir(obj)
+		names = dir(obj)
 	except Exception:
-		return []
+		return ()
+	if include_private:
+		return tuple(sorted({a for a in names if not a.startswith('__')}))
+	return tuple(sorted({a for a in names if not a.startswith('_')}))
+
+
+_LEAF_TYPES = (int, float, str, bool)
 
 
 def _is_data_leaf(value):
-	return isinstance(value, (int, float, str, bool)) or value is None
+	return isinstance(value, _LEAF_TYPES) or value is None
 
 
-def introspect_object(obj, name="root", depth=0, visited=None, max_depth=INTROSPECT_MAX_DEPTH, max_children=INTROSPECT_MAX_CHILDREN):
-	"""Recursively log accessible editor properties / attributes to help locate reduction settings path.
+# dir() results per type: dir() on a UE-wrapped object walks the reflected
+# property table, and every instance of a type yields the same list, so pay
+# for the walk (and the sort) once per type instead of once per object.
+_DIR_CACHE: dict[tuple[type, bool], tuple[str, ...]] = {}
 
-	We try get_editor_property for Unreal UObject derived instances and fall back to getattr for Python attributes.
-	"""
-	if visited is None:
-		visited = set()
-	try:
-		obj_id = (id(obj), getattr(obj, 'get_name', lambda: type(obj).__name__)())
-	except Exception:
-		obj_id = (id(obj), type(obj).__name__)
-	if obj_id in visited:
-		return
-	visited.add(obj_id)
 
-	prefix = '  ' * depth
-	try:
-		type_name = type(obj).__name__
-	except Exception:
-		type_name = '<unknown>'
-	unreal.log(f"[percenttriangles][INTROSPECT]{prefix}{name} : {type_name}")
+def _cached_dir(obj, include_private=False) -> tuple[str, ...]:
+	key = (type(obj), include_private)
+	names = _DIR_CACHE.get(key)
+	if names is None:
+		names = _safe_dir(obj, include_private)
+		_DIR_CACHE[key] = names
+	return names
 
-	if depth >= max_depth:
-		return
 
-	# Collect candidate attribute/property names
-	attr_names = []
-	if hasattr(obj, 'get_editor_property'):  # Unreal UObject
-		# Attempt to read property list via dir()
-		attr_names.extend([a for a in _safe_dir(obj) if not a.startswith('__')])
-	else:
-		attr_names.extend([a for a in _safe_dir(obj) if not a.startswith('__')])
+def introspect_object(obj, name="root", depth=0, visited=None, max_depth=INTROSPECT_MAX_DEPTH, max_children=INTROSPECT_MAX_CHILDREN):
+	"""Log accessible editor properties / attributes to help locate reduction settings path.
 
-	shown = 0
-	for attr in sorted(set(attr_names)):
-		if not INTROSPECT_INCLUDE_PRIVATE and attr.startswith('_'):
+	We try get_editor_property for Unreal UObject derived instances and fall back to getattr
+	for Python attributes. Traversal is an explicit breadth-first queue rather than
+	recursion: UE object graphs are wide and a deque keeps the walk flat instead of
+	stacking a Python frame (locals, visited set lookups and all) per level.
+	"""
+	if visited is None:
+		visited = set()
+	queue = deque()
+	queue.append((obj, name, depth))
+	while queue:
+		obj, name, depth = queue.popleft()
+		try:
+			obj_id = (id(obj), getattr(obj, 'get_name', lambda: type(obj).__name__)())
+		except Exception:
+			obj_id = (id(obj), type(obj).__name__)
+		if obj_id in visited:
 			continue
-		if shown >= max_children:
-			unreal.log(f"[percenttriangles][INTROSPECT]{prefix}... child limit reached ...")
-			break
-		value = None
-		got = False
-		# Prefer editor property access first
-		if hasattr(obj, 'get_editor_property'):
-			try:
-				value = obj.get_editor_property(attr)
-				got = True
-			except Exception:
-				pass
-		if not got:
-			try:
-				value = getattr(obj, attr)
-			except Exception:
-				continue
+		visited.add(obj_id)
+
+		# One prefix string per object instead of re-concatenating the tag and
+		# the indent inside every f-string below.
+		prefix = _INTROSPECT_PREFIX + '  ' * depth
 		try:
-			v_type = type(value).__name__
+			type_name = type(obj).__name__
 		except Exception:
-			v_type = '<unknown>'
-		# Print leaf or brief container summary
-		if _is_data_leaf(value):
-			unreal.log(f"[percenttriangles][INTROSPECT]{prefix}- {attr} = {value!r} ({v_type})")
-		elif isinstance(value, (list, tuple)):  # show size and maybe first element
-			unreal.log(f"[percenttriangles][INTROSPECT]{prefix}- {attr} : {v_type}[len={len(value)}]")
-			if value and depth + 1 <= max_depth:
-				# Recurse into first few entries
-				for idx, item in enumerate(value[: min(3, len(value))]):
-					introspect_object(item, name=f"{attr}[{idx}]", depth=depth + 1, visited=visited, max_depth=max_depth, max_children=max_children)
-		else:
-			unreal.log(f"[percenttriangles][INTROSPECT]{prefix}- {attr} : {v_type}")
-			# Recurse deeper
-			try:
-				introspect_object(value, name=attr, depth=depth + 1, visited=visited, max_depth=max_depth, max_children=max_children)
-			except Exception:
-				pass
-		shown += 1
+			type_name = '<unknown>'
+		unreal.log(f"{prefix}{name} : {type_name}")
+
+		if depth >= max_depth:
+			continue
+
+		shown = 0
+		for attr in _cached_dir(obj, INTROSPECT_INCLUDE_PRIVATE):
+			if shown >= max_children:
+				unreal.log(f"{prefix}... child limit reached ...")
+				break
+			value = None
+			got = False
+			# Prefer editor property access first
+			if hasattr(obj, 'get_editor_property'):
+				try:
+					value = obj.get_editor_property(attr)
+					got = True
+				except Exception:
+					pass
+			if not got:
+				try:
+					value = getattr(obj, attr)
+				except Exception:
+					continue
+			# Print leaf or brief container summary. The leaf check is the
+			# inlined tuple isinstance and the type-name lookup is deferred
+			# into each branch, so no attribute pays for work its branch
+			# does not print.
+			if value is None or isinstance(value, _LEAF_TYPES):
+				unreal.log(f"{prefix}- {attr} = {value!r} ({type(value).__name__})")
+			elif isinstance(value, (list, tuple)):  # show size and maybe first element
+				unreal.log(f"{prefix}- {attr} : {type(value).__name__}[len={len(value)}]")
+				if value and depth + 1 <= max_depth:
+					# Queue the first few entries
+					for idx, item in enumerate(value[: min(3, len(value))]):
+						queue.append((item, f"{attr}[{idx}]", depth + 1))
+			else:
+				unreal.log(f"{prefix}- {attr} : {type(value).__name__}")
+				queue.append((value, attr, depth + 1))
+			shown += 1
 
 
 def debug_introspect_first_mesh(token=NAME_TOKEN, max_depth=INTROSPECT_MAX_DEPTH):